@@ -10,26 +10,38 @@ import os
 import sys
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+import heapq
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, AsyncGenerator, Set
+from typing import Dict, List, Optional, AsyncGenerator, Set, Tuple
 import io
 
 logger = logging.getLogger(__name__)
 
 from collections import defaultdict
 import time
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse, JSONResponse
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, HttpUrl, Field
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    # orjson is optional; fall back to stdlib json
+    orjson = None
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.utils import load_config
+from src.utils import load_config, reload_config
 from src.services import process_video, ProgressUpdate
 
 
@@ -40,7 +52,11 @@ from src.services import process_video, ProgressUpdate
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
-    # Startup: Start background tasks
+    # Startup: remember the serving loop so worker threads can hand SSE
+    # frames to it without looking it up on every broadcast
+    app.state.loop = asyncio.get_running_loop()
+
+    # Start background tasks
     asyncio.create_task(job_cleanup_task())
     logger.info("Transcript Pipeline API started")
     yield
@@ -50,6 +66,8 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(
     lifespan=lifespan,
+    # orjson renders JSON bodies several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     title="Transcript Pipeline API",
     description="""
 ## Overview
@@ -103,7 +121,7 @@ async def rate_limit_middleware(request: Request, call_next):
         return await call_next(request)
 
     client_ip = request.client.host if request.client else "unknown"
-    now = time.time()
+    now = time.monotonic()
 
     with rate_limit_lock:
         # Clean old timestamps
@@ -125,9 +143,12 @@ async def rate_limit_middleware(request: Request, call_next):
     return await call_next(request)
 
 
-# In-memory job storage with thread-safe access
+# In-memory job storage.
+# Writers (job creation, pipeline updates, cleanup) serialize on jobs_lock;
+# readers don't lock: dict lookups are atomic under the GIL and each job is
+# only mutated by its own pipeline worker.
 jobs: Dict[str, dict] = {}
-jobs_lock = threading.RLock()
+jobs_lock = threading.Lock()
 
 # SSE event queues for real-time streaming (job_id -> set of queues)
 job_event_queues: Dict[str, Set[asyncio.Queue]] = {}
@@ -135,7 +156,31 @@ queues_lock = threading.Lock()
 
 # Job TTL configuration
 COMPLETED_JOB_TTL_HOURS = int(os.getenv("JOB_TTL_HOURS", "24"))
-JOB_CLEANUP_INTERVAL_MINUTES = 30
+COMPLETED_JOB_TTL_SECONDS = COMPLETED_JOB_TTL_HOURS * 3600
+# Each finished job gets its own expiry callback; the periodic sweep is
+# only a safety net for callbacks that never fired
+JOB_CLEANUP_INTERVAL_MINUTES = 60
+
+# Min-heap of (expires_at, job_id) for finished jobs, guarded by jobs_lock.
+# Deadlines use time.monotonic() so wall-clock adjustments can't expire
+# jobs early or keep them around forever.
+# Entries are pushed when a job reaches a terminal state, so cleanup only
+# touches jobs that are actually due instead of scanning the whole table.
+_expiry_heap: List[Tuple[float, str]] = []
+
+TERMINAL_STATUSES = ('complete', 'error')
+
+# Last SSE frame broadcast per job (guarded by jobs_lock), used to skip
+# fan-out when an update leaves the serialized snapshot unchanged
+_last_frames: Dict[str, bytes] = {}
+
+# Pipeline execution: long-running pipelines get their own bounded pool so
+# they can't starve the default executor used for short blocking calls
+PIPELINE_WORKERS = max(1, int(os.getenv("PIPELINE_WORKERS", "2")))
+PIPELINE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PIPELINE_WORKERS,
+    thread_name_prefix="pipeline",
+)
 
 
 # ============================================================================
@@ -163,14 +208,37 @@ class JobStatus(BaseModel):
     completed_at: Optional[str] = None
 
 
+# ============================================================================
+# Timestamps
+# ============================================================================
+
+# (epoch_second, iso_string) for the last formatted second. Rebinding a
+# tuple is atomic, so concurrent callers at worst format the same second twice.
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string at one-second resolution.
+
+    The formatted string is reused for every call within the same second,
+    so frequent job updates don't each pay for datetime.now().isoformat().
+    """
+    global _iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _iso_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _iso_cache = (second, cached_iso)
+    return cached_iso
+
+
 # ============================================================================
 # Thread-Safe Job Access
 # ============================================================================
 
 def get_job(job_id: str) -> Optional[dict]:
-    """Thread-safe job retrieval."""
-    with jobs_lock:
-        return jobs.get(job_id)
+    """Lock-free job retrieval. The returned dict must be treated as read-only."""
+    return jobs.get(job_id)
 
 
 def set_job(job_id: str, job: dict) -> None:
@@ -180,12 +248,17 @@ def set_job(job_id: str, job: dict) -> None:
 
 
 def update_job(job_id: str, **updates) -> Optional[dict]:
-    """Thread-safe job field updates. Returns updated job or None if not found."""
+    """Thread-safe job field updates. Returns updated job or None if not found.
+
+    The stored dict is updated in place and returned without copying;
+    callers must treat it as read-only.
+    """
     with jobs_lock:
-        if job_id not in jobs:
+        job = jobs.get(job_id)
+        if job is None:
             return None
-        jobs[job_id].update(updates)
-        return jobs[job_id].copy()
+        job.update(updates)
+        return job
 
 
 # ============================================================================
@@ -200,28 +273,19 @@ def cleanup_expired_jobs() -> int:
     if COMPLETED_JOB_TTL_HOURS <= 0:
         return 0  # TTL disabled
 
-    cutoff = datetime.now() - timedelta(hours=COMPLETED_JOB_TTL_HOURS)
+    now = time.monotonic()
     expired_ids = []
 
     with jobs_lock:
-        for job_id, job in jobs.items():
-            # Only clean up terminal states
-            if job.get('status') not in ('complete', 'error'):
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            _, job_id = heapq.heappop(_expiry_heap)
+            job = jobs.get(job_id)
+            # Skip stale entries (job already removed or no longer terminal)
+            if job is None or job.get('status') not in TERMINAL_STATUSES:
                 continue
-
-            # Check completed_at timestamp
-            completed_at = job.get('completed_at')
-            if completed_at:
-                try:
-                    completed_time = datetime.fromisoformat(completed_at)
-                    if completed_time < cutoff:
-                        expired_ids.append(job_id)
-                except (ValueError, TypeError):
-                    pass  # Invalid timestamp, skip
-
-        # Remove expired jobs
-        for job_id in expired_ids:
             del jobs[job_id]
+            _last_frames.pop(job_id, None)
+            expired_ids.append(job_id)
 
     if expired_ids:
         logger.info(f"Cleaned up {len(expired_ids)} expired jobs (TTL: {COMPLETED_JOB_TTL_HOURS}h)")
@@ -229,6 +293,40 @@ def cleanup_expired_jobs() -> int:
     return len(expired_ids)
 
 
+def _expire_job(job_id: str) -> None:
+    """Drop a finished job and its SSE registry entry once its TTL elapses.
+
+    Runs on the event loop via loop.call_later().
+    """
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None or job.get('status') not in TERMINAL_STATUSES:
+            return
+        del jobs[job_id]
+        _last_frames.pop(job_id, None)
+
+    with queues_lock:
+        job_event_queues.pop(job_id, None)
+
+    logger.debug(f"Expired job {job_id} (TTL: {COMPLETED_JOB_TTL_HOURS}h)")
+
+
+def _schedule_job_expiry(job_id: str) -> None:
+    """Arm a one-shot expiry callback for a job that just finished.
+
+    Safe to call from worker threads. If the server loop isn't available the
+    job is still collected by the periodic sweep.
+    """
+    loop = _get_server_loop()
+    if loop is None:
+        return
+    try:
+        loop.call_soon_threadsafe(loop.call_later, COMPLETED_JOB_TTL_SECONDS, _expire_job, job_id)
+    except RuntimeError:
+        # Loop closed during shutdown
+        pass
+
+
 async def job_cleanup_task():
     """Background task that periodically cleans up expired jobs."""
     logger.info(f"Job cleanup task started (interval: {JOB_CLEANUP_INTERVAL_MINUTES}m, TTL: {COMPLETED_JOB_TTL_HOURS}h)")
@@ -244,24 +342,66 @@ async def job_cleanup_task():
 # SSE Event Broadcasting
 # ============================================================================
 
-def broadcast_job_update(job_id: str, job_data: dict) -> None:
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+SSE_KEEPALIVE_SECONDS = 30.0
+# Job state is a snapshot, not an event log: a slow client only needs the
+# newest frame, so per-client queues stay tiny and drop their oldest entry.
+SSE_QUEUE_MAXSIZE = 2
+
+
+def _build_sse_frame(job_data: dict) -> bytes:
+    """Serialize a job snapshot into a ready-to-send SSE data frame."""
+    return b"data: " + _json_dumps(job_data) + b"\n\n"
+
+
+def _get_server_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the loop cached by lifespan(), or None if it isn't running."""
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(app.state, "loop", None)
+    if loop is None or loop.is_closed():
+        return None
+    return loop
+
+
+def _put_latest(queue: asyncio.Queue, item: Tuple[bytes, bool]) -> None:
+    """Enqueue an SSE item, evicting the oldest one if the queue is full.
+
+    Must run on the event loop thread (scheduled via call_soon_threadsafe).
+    """
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        queue.put_nowait(item)
+
+
+def broadcast_job_update(job_id: str, frame: bytes, is_terminal: bool) -> None:
     """
-    Push job update to all connected SSE clients for this job.
+    Push a pre-encoded job frame to all connected SSE clients for this job.
     This is called from the processing thread and schedules async queue puts.
+
+    The same frame is fanned out to every subscriber, so the cost does not
+    grow with the number of clients.
     """
+    loop = _get_server_loop()
+    if loop is None:
+        # Server loop not running (e.g. lifespan not started), nothing to notify
+        return
+
+    # Snapshot subscribers so the lock isn't held while scheduling callbacks
     with queues_lock:
-        queues = job_event_queues.get(job_id, set())
-        for queue in queues:
-            try:
-                # Use call_soon_threadsafe to schedule from sync context
-                loop = asyncio.get_event_loop()
-                loop.call_soon_threadsafe(queue.put_nowait, job_data)
-            except RuntimeError:
-                # Event loop not running, skip
-                pass
-            except asyncio.QueueFull:
-                # Queue full, skip this update
-                pass
+        queues = list(job_event_queues.get(job_id, ()))
+
+    item = (frame, is_terminal)
+    for queue in queues:
+        try:
+            # Use call_soon_threadsafe to schedule from sync context
+            loop.call_soon_threadsafe(_put_latest, queue, item)
+        except RuntimeError:
+            # Event loop closed between the check and the call, skip
+            pass
 
 
 def register_sse_queue(job_id: str, queue: asyncio.Queue) -> None:
@@ -285,11 +425,78 @@ def unregister_sse_queue(job_id: str, queue: asyncio.Queue) -> None:
 # Pipeline Processing
 # ============================================================================
 
+class PipelineAdmission:
+    """Caps the number of pipelines running at once.
+
+    Jobs beyond the limit wait here (still 'pending') instead of piling up
+    in the executor's work queue; each finished pipeline wakes the next one.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def is_full(self) -> bool:
+        return self.active >= self.limit
+
+    async def __aenter__(self) -> "PipelineAdmission":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+pipeline_admission = PipelineAdmission(PIPELINE_WORKERS)
+
+# Strong references to running pipeline tasks; the event loop only keeps
+# weak ones, so an unreferenced task could be garbage-collected mid-run
+_pipeline_tasks: Set[asyncio.Task] = set()
+
+
+def _start_pipeline_task(job_id: str, url: str, llm_type: str, extract: bool) -> asyncio.Task:
+    """Launch process_video_async detached from the request that created it."""
+    task = asyncio.create_task(process_video_async(job_id, url, llm_type, extract))
+    _pipeline_tasks.add(task)
+    task.add_done_callback(_pipeline_tasks.discard)
+    return task
+
+
 def _update_and_broadcast(job_id: str, **updates) -> None:
-    """Helper to update job and broadcast to SSE clients."""
-    job = update_job(job_id, **updates)
-    if job:
-        broadcast_job_update(job_id, job)
+    """Helper to update job and broadcast to SSE clients.
+
+    The job is serialized while the lock is held so the frame reflects a
+    consistent snapshot, then fanned out after the lock is released.
+    """
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None:
+            return
+        was_terminal = job['status'] in TERMINAL_STATUSES
+        job.update(updates)
+        frame = _build_sse_frame(job)
+        is_terminal = job['status'] in TERMINAL_STATUSES
+
+        # Identical snapshot: subscribers already have it, nothing to send
+        if _last_frames.get(job_id) == frame:
+            return
+        _last_frames[job_id] = frame
+
+        # Schedule expiry once, on the transition into a terminal state
+        schedule_expiry = is_terminal and not was_terminal and COMPLETED_JOB_TTL_SECONDS > 0
+        if schedule_expiry:
+            heapq.heappush(_expiry_heap, (time.monotonic() + COMPLETED_JOB_TTL_SECONDS, job_id))
+
+    if schedule_expiry:
+        _schedule_job_expiry(job_id)
+
+    broadcast_job_update(job_id, frame, is_terminal)
 
 
 async def process_video_async(job_id: str, url: str, llm_type: str, extract: bool):
@@ -314,8 +521,8 @@ async def process_video_async(job_id: str, url: str, llm_type: str, extract: boo
             updates['progress'] = update.progress
         if update.metadata is not None:
             updates['metadata'] = update.metadata
-        if update.status in ('complete', 'error'):
-            updates['completed_at'] = datetime.now().isoformat()
+        if update.status in TERMINAL_STATUSES:
+            updates['completed_at'] = _now_iso()
 
         _update_and_broadcast(job_id, **updates)
 
@@ -334,7 +541,11 @@ async def process_video_async(job_id: str, url: str, llm_type: str, extract: boo
         return result
 
     try:
-        result = await loop.run_in_executor(None, run_pipeline)
+        if pipeline_admission.is_full:
+            _update_and_broadcast(job_id, message='Waiting for a free pipeline worker...')
+
+        async with pipeline_admission:
+            result = await loop.run_in_executor(PIPELINE_EXECUTOR, run_pipeline)
 
         # Update job with final paths
         final_updates = {}
@@ -348,14 +559,14 @@ async def process_video_async(job_id: str, url: str, llm_type: str, extract: boo
                 status='complete',
                 phase='complete',
                 progress=100,
-                completed_at=datetime.now().isoformat()
+                completed_at=_now_iso()
             )
         elif result.get('error'):
             final_updates.update(
                 status='error',
                 error=result['error'],
                 message=f"Error: {result['error']}",
-                completed_at=datetime.now().isoformat()
+                completed_at=_now_iso()
             )
 
         if final_updates:
@@ -366,7 +577,7 @@ async def process_video_async(job_id: str, url: str, llm_type: str, extract: boo
             status='error',
             error=str(e),
             message=f'Error: {str(e)}',
-            completed_at=datetime.now().isoformat()
+            completed_at=_now_iso()
         )
 
 
@@ -374,8 +585,11 @@ async def process_video_async(job_id: str, url: str, llm_type: str, extract: boo
 # API Endpoints
 # ============================================================================
 
+# Handlers that touch the filesystem before responding are plain `def` so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
+
 @app.get("/", tags=["Frontend"])
-async def root():
+def root():
     """Serve the frontend HTML."""
     frontend_path = Path(__file__).parent / "frontend" / "index.html"
     if frontend_path.exists():
@@ -386,11 +600,12 @@ async def root():
 @app.get("/api/health", tags=["System"])
 async def health():
     """Health check endpoint."""
-    with jobs_lock:
-        job_count = len(jobs)
-        completed_count = sum(1 for j in jobs.values() if j.get('status') == 'complete')
-        error_count = sum(1 for j in jobs.values() if j.get('status') == 'error')
-        active_count = job_count - completed_count - error_count
+    # Snapshot without locking; list() copies the values atomically
+    snapshot = list(jobs.values())
+    job_count = len(snapshot)
+    completed_count = sum(1 for j in snapshot if j.get('status') == 'complete')
+    error_count = sum(1 for j in snapshot if j.get('status') == 'error')
+    active_count = job_count - completed_count - error_count
 
     return {
         "service": "Transcript Pipeline API",
@@ -407,7 +622,7 @@ async def health():
 
 
 @app.post("/api/process", response_model=JobStatus, tags=["Jobs"])
-async def start_processing(request: ProcessRequest, background_tasks: BackgroundTasks):
+async def start_processing(request: ProcessRequest):
     """
     Start processing a YouTube video.
     Returns a job ID that can be used to track progress.
@@ -429,19 +644,14 @@ async def start_processing(request: ProcessRequest, background_tasks: Background
         'summary_path': None,
         # Note: content is read from disk on demand, not stored in job
         'error': None,
-        'created_at': datetime.now().isoformat(),
+        'created_at': _now_iso(),
         'completed_at': None,
     }
     set_job(job_id, job)
 
-    # Start processing in background
-    background_tasks.add_task(
-        process_video_async,
-        job_id,
-        request.url,
-        llm_type,
-        request.extract
-    )
+    # Start processing as a standalone task so the request scope is released
+    # as soon as the response goes out; admission limits concurrency
+    _start_pipeline_task(job_id, request.url, llm_type, request.extract)
 
     return JobStatus(**job)
 
@@ -466,39 +676,49 @@ async def stream_job_status(job_id: str):
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        # Create a queue for this SSE connection
-        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        # Create a queue for this SSE connection.
+        # Items are (frame, is_terminal) tuples pre-encoded by broadcast_job_update.
+        queue: asyncio.Queue[Tuple[bytes, bool]] = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
         register_sse_queue(job_id, queue)
 
         try:
             # Send initial state immediately
             current_job = get_job(job_id)
             if current_job:
-                yield f"data: {json.dumps(current_job)}\n\n"
+                yield _build_sse_frame(current_job)
 
                 # If already complete, stop
-                if current_job['status'] in ('complete', 'error'):
+                if current_job['status'] in TERMINAL_STATUSES:
                     return
 
-            # Wait for pushed updates
-            while True:
-                try:
-                    # Wait for next update with timeout
-                    job_data = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {json.dumps(job_data)}\n\n"
+            # Wait for pushed updates. A single pending get() task is reused
+            # across keepalive intervals; asyncio.wait() returns on timeout
+            # instead of raising, so idle connections don't churn exceptions.
+            get_task = asyncio.create_task(queue.get())
+            try:
+                while True:
+                    done, _ = await asyncio.wait({get_task}, timeout=SSE_KEEPALIVE_SECONDS)
+
+                    if get_task in done:
+                        frame, is_terminal = get_task.result()
+                        yield frame
+
+                        # Stop streaming when job is complete or errored
+                        if is_terminal:
+                            break
+                        get_task = asyncio.create_task(queue.get())
+                        continue
 
-                    # Stop streaming when job is complete or errored
-                    if job_data.get('status') in ('complete', 'error'):
-                        break
-                except asyncio.TimeoutError:
                     # Send keepalive comment to prevent connection timeout
-                    yield ": keepalive\n\n"
+                    yield SSE_KEEPALIVE_FRAME
 
                     # Check if job still exists
                     current_job = get_job(job_id)
-                    if not current_job or current_job['status'] in ('complete', 'error'):
+                    if not current_job or current_job['status'] in TERMINAL_STATUSES:
                         break
+            finally:
+                get_task.cancel()
         finally:
             unregister_sse_queue(job_id, queue)
 
@@ -513,6 +733,22 @@ async def stream_job_status(job_id: str):
     )
 
 
+async def _read_job_file(path: Optional[str], label: str) -> str:
+    """Read a job output file in a worker thread so the event loop isn't blocked.
+
+    A missing path or file maps to 404; other I/O errors map to 500.
+    """
+    if not path:
+        raise HTTPException(status_code=404, detail=f"{label} not available")
+
+    try:
+        return await asyncio.to_thread(Path(path).read_text, encoding='utf-8')
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"{label} not available")
+    except IOError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to read {label.lower()}: {e}")
+
+
 @app.get("/api/jobs/{job_id}/transcript", tags=["Jobs"])
 async def get_transcript(job_id: str):
     """Get the transcript content for a completed job.
@@ -524,14 +760,7 @@ async def get_transcript(job_id: str):
         raise HTTPException(status_code=404, detail="Job not found")
 
     transcript_path = job.get('transcript_path')
-    if not transcript_path or not Path(transcript_path).exists():
-        raise HTTPException(status_code=404, detail="Transcript not available")
-
-    # Read from disk on demand
-    try:
-        content = Path(transcript_path).read_text(encoding='utf-8')
-    except IOError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to read transcript: {e}")
+    content = await _read_job_file(transcript_path, "Transcript")
 
     return {
         "content": content,
@@ -550,14 +779,7 @@ async def get_summary(job_id: str):
         raise HTTPException(status_code=404, detail="Job not found")
 
     summary_path = job.get('summary_path')
-    if not summary_path or not Path(summary_path).exists():
-        raise HTTPException(status_code=404, detail="Summary not available")
-
-    # Read from disk on demand
-    try:
-        content = Path(summary_path).read_text(encoding='utf-8')
-    except IOError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to read summary: {e}")
+    content = await _read_job_file(summary_path, "Summary")
 
     return {
         "content": content,
@@ -566,7 +788,7 @@ async def get_summary(job_id: str):
 
 
 @app.get("/api/jobs/{job_id}/download/{file_type}", tags=["Jobs"])
-async def download_file(job_id: str, file_type: str):
+def download_file(job_id: str, file_type: str):
     """Download the transcript or summary file."""
     job = get_job(job_id)
     if job is None:
@@ -589,12 +811,10 @@ async def download_file(job_id: str, file_type: str):
     )
 
 
-@app.get("/api/config", tags=["System"])
-async def get_config():
-    """Get current pipeline configuration (without sensitive data)."""
-    config = load_config()
+def _public_config(config: dict) -> dict:
+    """Build the client-facing view of the configuration (no secrets)."""
     transcription_engine = config.get('transcription_engine', 'auto')
-    
+
     return {
         "default_llm": config.get('default_llm', 'claude'),
         "output_dir": config.get('output_dir', './output'),
@@ -606,10 +826,38 @@ async def get_config():
     }
 
 
+@app.get("/api/config", tags=["System"])
+async def get_config():
+    """Get current pipeline configuration (without sensitive data)."""
+    config = load_config()
+    return _public_config(config)
+
+
+@app.post("/api/config/reload", tags=["System"])
+async def reload_pipeline_config():
+    """Re-read .env and environment variables, replacing the cached configuration."""
+    config = reload_config()
+    logger.info("Configuration reloaded")
+    return _public_config(config)
+
+
 # ============================================================================
 # Run Server
 # ============================================================================
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # uvloop speeds up task scheduling (call_soon_threadsafe fan-out) and
+    # httptools parses requests faster than h11; both ship with
+    # uvicorn[standard]. Fall back to the pure-Python stack if missing.
+    # Workers stay at 1: job state and SSE subscribers live in this process.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true",
+    )
@@ -9,6 +9,7 @@ This module provides:
 import os
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -182,6 +183,12 @@ def load_pipeline_config() -> PipelineConfig:
     )
 
 
+@lru_cache(maxsize=1)
+def _load_config_cached() -> dict:
+    """Parse .env and environment once; see load_config()."""
+    return load_pipeline_config().to_dict()
+
+
 def load_config() -> dict:
     """
     Load configuration from environment variables.
@@ -190,11 +197,29 @@ def load_config() -> dict:
     For new code, prefer using load_pipeline_config() which returns
     a typed PipelineConfig dataclass.
 
+    The .env file and environment are only parsed on the first call;
+    later calls return a copy of the cached values. Use reload_config()
+    to pick up changes.
+
     Returns:
         Dictionary containing configuration values
     """
-    config = load_pipeline_config()
-    return config.to_dict()
+    return dict(_load_config_cached())
+
+
+def reload_config() -> dict:
+    """
+    Discard the cached configuration and load it again.
+
+    Values from .env override variables already present in the
+    environment, so edits to .env take effect without a restart.
+
+    Returns:
+        Dictionary containing the freshly loaded configuration values
+    """
+    load_dotenv(override=True)
+    _load_config_cached.cache_clear()
+    return load_config()
 
 
 def validate_config(config: dict, no_extract: bool = False) -> None:
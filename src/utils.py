@@ -9,6 +9,7 @@ from typing import Callable, Any
 # Re-export config functions for backward compatibility
 from .config import (
     load_config,
+    reload_config,
     validate_config,
     ConfigurationError,
     load_pipeline_config,
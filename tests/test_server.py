@@ -51,6 +51,16 @@ class TestConfigEndpoint:
         assert "transcription_engine" in data
         assert "mlx_whisper_model" in data
 
+    def test_config_reload_picks_up_environment_changes(self, client, monkeypatch):
+        monkeypatch.setenv("MLX_WHISPER_MODEL", "tiny")
+        response = client.post("/api/config/reload")
+        assert response.status_code == 200
+        assert response.json()["mlx_whisper_model"] == "tiny"
+        assert client.get("/api/config").json()["mlx_whisper_model"] == "tiny"
+
+        monkeypatch.delenv("MLX_WHISPER_MODEL")
+        client.post("/api/config/reload")
+
 
 class TestProcessEndpoint:
     """Tests for process endpoint."""
@@ -111,6 +121,33 @@ class TestJobEndpoints:
         data = status_response.json()
         assert data["job_id"] == job_id
 
+    def test_transcript_read_from_disk(self, client, tmp_path):
+        import server
+
+        transcript_file = tmp_path / "video-transcript.md"
+        transcript_file.write_text("# Transcript", encoding="utf-8")
+        server.set_job("disk-job", {
+            "job_id": "disk-job",
+            "status": "complete",
+            "transcript_path": str(transcript_file),
+        })
+
+        response = client.get("/api/jobs/disk-job/transcript")
+        assert response.status_code == 200
+        assert response.json()["content"] == "# Transcript"
+
+    def test_transcript_missing_file(self, client, tmp_path):
+        import server
+
+        server.set_job("gone-job", {
+            "job_id": "gone-job",
+            "status": "complete",
+            "transcript_path": str(tmp_path / "deleted.md"),
+        })
+
+        response = client.get("/api/jobs/gone-job/transcript")
+        assert response.status_code == 404
+
     def test_download_invalid_type(self, client):
         # Create a job first
         create_response = client.post(
@@ -157,3 +194,166 @@ class TestRootEndpoint:
         response = client.get("/")
         # Should return HTML or error if frontend not found
         assert response.status_code in [200, 404]
+
+
+class TestSSEFrames:
+    """Tests for pre-encoded SSE frames."""
+
+    def test_build_sse_frame_is_bytes(self):
+        from server import _build_sse_frame
+
+        frame = _build_sse_frame({"job_id": "abc", "status": "pending"})
+        assert isinstance(frame, bytes)
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        assert b'"job_id"' in frame
+
+    def test_update_and_broadcast_sends_serialized_frame(self):
+        import server
+
+        server.set_job("frame-job", {"job_id": "frame-job", "status": "pending"})
+        with patch.object(server, "broadcast_job_update") as mock_broadcast:
+            server._update_and_broadcast("frame-job", status="complete")
+
+        job_id, frame, is_terminal = mock_broadcast.call_args.args
+        assert job_id == "frame-job"
+        assert b'"complete"' in frame
+        assert is_terminal is True
+        assert server.get_job("frame-job")["status"] == "complete"
+
+    def test_put_latest_drops_oldest_frame(self):
+        import asyncio
+        from server import _put_latest, SSE_QUEUE_MAXSIZE
+
+        async def fill():
+            queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
+            for i in range(SSE_QUEUE_MAXSIZE + 3):
+                _put_latest(queue, (str(i).encode(), False))
+            return [queue.get_nowait()[0] for _ in range(queue.qsize())]
+
+        frames = asyncio.run(fill())
+        assert len(frames) == SSE_QUEUE_MAXSIZE
+        assert frames[-1] == str(SSE_QUEUE_MAXSIZE + 2).encode()
+
+    def test_broadcast_from_worker_thread_reaches_queue(self):
+        import asyncio
+        import server
+
+        async def run():
+            server.app.state.loop = asyncio.get_running_loop()
+            queue = asyncio.Queue(maxsize=server.SSE_QUEUE_MAXSIZE)
+            server.register_sse_queue("thread-job", queue)
+            try:
+                await asyncio.to_thread(
+                    server.broadcast_job_update, "thread-job", b"data: {}\n\n", True
+                )
+                return await asyncio.wait_for(queue.get(), timeout=1.0)
+            finally:
+                server.unregister_sse_queue("thread-job", queue)
+                del server.app.state.loop
+
+        assert asyncio.run(run()) == (b"data: {}\n\n", True)
+
+
+class TestJobCleanup:
+    """Tests for TTL-based job cleanup."""
+
+    def test_cleanup_removes_only_expired_terminal_jobs(self):
+        import server
+
+        server.set_job("ttl-done", {"job_id": "ttl-done", "status": "pending"})
+        server.set_job("ttl-active", {"job_id": "ttl-active", "status": "pending"})
+        with patch.object(server, "broadcast_job_update"):
+            server._update_and_broadcast("ttl-done", status="complete")
+            server._update_and_broadcast("ttl-active", status="transcribing")
+
+        # Nothing has expired yet
+        assert server.cleanup_expired_jobs() == 0
+        assert server.get_job("ttl-done") is not None
+
+        future = server.time.monotonic() + server.COMPLETED_JOB_TTL_SECONDS + 1
+        with patch.object(server.time, "monotonic", return_value=future):
+            assert server.cleanup_expired_jobs() >= 1
+
+        assert server.get_job("ttl-done") is None
+        assert server.get_job("ttl-active") is not None
+
+
+class TestPipelineAdmission:
+    """Tests for the concurrent pipeline limit."""
+
+    def test_admission_limits_concurrency(self):
+        import asyncio
+        from server import PipelineAdmission
+
+        async def run():
+            admission = PipelineAdmission(limit=1)
+            peak = 0
+
+            async def job():
+                nonlocal peak
+                async with admission:
+                    peak = max(peak, admission.active)
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(*(job() for _ in range(3)))
+            return peak, admission.active
+
+        assert asyncio.run(run()) == (1, 0)
+
+    def test_finished_job_expires_via_scheduled_callback(self):
+        import asyncio
+        import server
+
+        server.set_job("ttl-timer", {"job_id": "ttl-timer", "status": "pending"})
+
+        async def run():
+            server.app.state.loop = asyncio.get_running_loop()
+            try:
+                await asyncio.to_thread(server._update_and_broadcast, "ttl-timer", status="error")
+                await asyncio.sleep(0.1)
+            finally:
+                del server.app.state.loop
+
+        with patch.object(server, "COMPLETED_JOB_TTL_SECONDS", 0.01):
+            asyncio.run(run())
+
+        assert server.get_job("ttl-timer") is None
+
+
+class TestTimestamps:
+    """Tests for cached ISO timestamps."""
+
+    def test_now_iso_is_second_resolution_and_parseable(self):
+        from datetime import datetime
+        from server import _now_iso
+
+        stamp = _now_iso()
+        parsed = datetime.fromisoformat(stamp)
+        assert parsed.microsecond == 0
+        assert abs((datetime.now() - parsed).total_seconds()) < 2
+
+
+class TestBroadcastDedup:
+    """Tests for skipping unchanged job snapshots."""
+
+    def test_identical_update_is_not_rebroadcast(self):
+        import server
+
+        server.set_job("dedup-job", {"job_id": "dedup-job", "status": "pending"})
+        with patch.object(server, "broadcast_job_update") as mock_broadcast:
+            server._update_and_broadcast("dedup-job", status="downloading", progress=5)
+            server._update_and_broadcast("dedup-job", status="downloading", progress=5)
+            server._update_and_broadcast("dedup-job", status="downloading", progress=10)
+
+        assert mock_broadcast.call_count == 2
+
+
+class TestResponseClass:
+    """Tests for the default JSON response class."""
+
+    def test_json_endpoints_use_orjson(self):
+        from fastapi.responses import ORJSONResponse
+        from server import app
+
+        assert app.router.default_response_class is ORJSONResponse